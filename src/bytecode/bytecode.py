@@ -53,45 +53,45 @@ class BaseBytecode:
         self.argcount = bytecode.argcount
         self.posonlyargcount = bytecode.posonlyargcount
         self.kwonlyargcount = bytecode.kwonlyargcount
-        self.flags = bytecode.flags
+        # The flags of a bytecode are always a CompilerFlags so the conversion
+        # performed by the setter is not needed.
+        self._flags = bytecode._flags
         self.first_lineno = bytecode.first_lineno
         self.name = bytecode.name
         self.qualname = bytecode.qualname
         self.filename = bytecode.filename
         self.docstring = bytecode.docstring
-        self.cellvars = list(bytecode.cellvars)
-        self.freevars = list(bytecode.freevars)
+        # Most code objects have no cell or free variables, avoid going through
+        # list() for those.
+        self.cellvars = list(bytecode.cellvars) if bytecode.cellvars else []
+        self.freevars = list(bytecode.freevars) if bytecode.freevars else []
+
+    def _identity_tuple(self) -> tuple:
+        # Scalar attributes compared by __eq__, packed so that the comparison is
+        # performed by a single tuple comparison.
+        return (
+            self.argcount,
+            self.posonlyargcount,
+            self.kwonlyargcount,
+            self._flags,
+            self.first_lineno,
+            self.filename,
+            self.name,
+            self.qualname,
+            self.docstring,
+            self.cellvars,
+            self.freevars,
+        )
 
     def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
         if type(self) is not type(other):
             return False
 
-        if self.argcount != other.argcount:
-            return False
-        if self.posonlyargcount != other.posonlyargcount:
-            return False
-        if self.kwonlyargcount != other.kwonlyargcount:
-            return False
-        if self.flags != other.flags:
-            return False
-        if self.first_lineno != other.first_lineno:
-            return False
-        if self.filename != other.filename:
-            return False
-        if self.name != other.name:
-            return False
-        if self.qualname != other.qualname:
-            return False
-        if self.docstring != other.docstring:
-            return False
-        if self.cellvars != other.cellvars:
-            return False
-        if self.freevars != other.freevars:
-            return False
-        if self.compute_stacksize() != other.compute_stacksize():
-            return False
-
-        return True
+        # The stack size is not compared: it is derived from the flags and the
+        # content (instructions, exception table) which the subclasses compare.
+        return self._identity_tuple() == other._identity_tuple()
 
     @property
     def flags(self) -> CompilerFlags:
@@ -141,27 +141,30 @@ class _BaseBytecodeList(BaseBytecode, list, Generic[U]):
 
     def legalize(self) -> None:
         """Check that all the element of the list are valid and remove SetLineno."""
-        lineno_pos = []
+        # Build the filtered list in a single pass and replace the content at
+        # once rather than deleting SetLineno one at a time.
+        instructions: List[U] = []
         set_lineno = None
         current_lineno = self.first_lineno
 
-        for pos, instr in enumerate(self):
-            if isinstance(instr, SetLineno):
+        for instr in self:
+            # Test for actual instructions first since they are the most common
+            if isinstance(instr, BaseInstr):
+                instructions.append(instr)
+                if set_lineno is not None:
+                    instr.lineno = set_lineno
+                elif instr.lineno is UNSET:
+                    instr.lineno = current_lineno
+                elif instr.lineno is not None:
+                    current_lineno = instr.lineno
+            elif isinstance(instr, SetLineno):
                 set_lineno = instr.lineno
-                lineno_pos.append(pos)
-                continue
-            # Filter out other pseudo instructions
-            if not isinstance(instr, BaseInstr):
-                continue
-            if set_lineno is not None:
-                instr.lineno = set_lineno
-            elif instr.lineno is UNSET:
-                instr.lineno = current_lineno
-            elif instr.lineno is not None:
-                current_lineno = instr.lineno
-
-        for i in reversed(lineno_pos):
-            del self[i]
+            else:
+                # Keep other pseudo instructions as is
+                instructions.append(instr)
+
+        if len(instructions) != len(self):
+            self[:] = instructions
 
     def __iter__(self) -> Iterator[U]:
         instructions = super().__iter__()
@@ -169,6 +172,14 @@ class _BaseBytecodeList(BaseBytecode, list, Generic[U]):
             self._check_instr(instr)
             yield instr
 
+    def _iter_unchecked(self) -> Iterator[U]:
+        """Iterate over the items without validating them.
+
+        Only meant for internal consumers that already validated the items.
+
+        """
+        return list.__iter__(self)
+
     def _check_instr(self, instr):
         raise NotImplementedError()
 
@@ -180,33 +191,45 @@ class _InstrList(List[V]):
     # Providing a stricter typing for this helper whose use is limited to the __eq__
     # implementation is more effort than it is worth.
     def _flat(self) -> List:
-        instructions: List = []
-        labels = {}
+        # _flat produces exactly one item per element so preallocate the list.
+        instructions: List = [None] * len(self)
+        labels: Dict[Label, int] = {}
         jumps = []
         try_begins: Dict[TryBegin, int] = {}
         try_jumps = []
 
         offset = 0
         instr: Any
-        for index, instr in enumerate(self):
-            if isinstance(instr, Label):
-                instructions.append("label_instr%s" % index)
+        # Equality does not need the validation performed by __iter__.
+        for index, instr in enumerate(list.__iter__(self)):
+            # Instr are by far the most common items so test for them first.
+            if isinstance(instr, Instr):
+                if isinstance(instr.arg, Label):
+                    # Backward jumps can be resolved immediately, only forward
+                    # jumps need to be fixed up once all labels are known.
+                    target_label = instr.arg
+                    target = labels.get(target_label)
+                    instr = _bytecode.ConcreteInstr(
+                        instr.name,
+                        0 if target is None else target,
+                        location=instr.location,
+                    )
+                    if target is None:
+                        jumps.append((target_label, instr))
+                instructions[index] = instr
+                offset += 1
+            elif isinstance(instr, Label):
+                instructions[index] = ("Label", index)
                 labels[instr] = offset
             elif isinstance(instr, TryBegin):
                 try_begins.setdefault(instr, len(try_begins))
                 assert isinstance(instr.target, Label)
-                try_jumps.append((instr.target, len(instructions)))
-                instructions.append(instr)
+                try_jumps.append((instr.target, index))
+                instructions[index] = instr
             elif isinstance(instr, TryEnd):
-                instructions.append(("TryEnd", try_begins[instr.entry]))
+                instructions[index] = ("TryEnd", try_begins[instr.entry])
             else:
-                if isinstance(instr, Instr) and isinstance(instr.arg, Label):
-                    target_label = instr.arg
-                    instr = _bytecode.ConcreteInstr(
-                        instr.name, 0, location=instr.location
-                    )
-                    jumps.append((target_label, instr))
-                instructions.append(instr)
+                instructions[index] = instr
                 offset += 1
 
         for target_label, instr in jumps:
@@ -225,12 +248,22 @@ class _InstrList(List[V]):
         return instructions
 
     def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, _InstrList):
             other = _InstrList(other)
 
+        # _flat produces one item per element, so lists of different lengths
+        # cannot compare equal.
+        if len(self) != len(other):
+            return False
+
         return self._flat() == other._flat()
 
 
+_BYTECODE_ITEM_TYPES = frozenset((Label, SetLineno, Instr, TryBegin, TryEnd))
+
+
 class Bytecode(
     _InstrList[Union[Instr, Label, TryBegin, TryEnd, SetLineno]],
     _BaseBytecodeList[Union[Instr, Label, TryBegin, TryEnd, SetLineno]],
@@ -241,12 +274,19 @@ class Bytecode(
     ) -> None:
         BaseBytecode.__init__(self)
         self.argnames: List[str] = []
-        for instr in instructions:
-            self._check_instr(instr)
-        self.extend(instructions)
+        if isinstance(instructions, Bytecode):
+            # Iterating over a Bytecode validates its items, so extend from its
+            # iterator rather than validating them a second time.
+            self.extend(iter(instructions))
+        else:
+            for instr in instructions:
+                self._check_instr(instr)
+            self.extend(instructions)
 
     def __iter__(self) -> Iterator[Union[Instr, Label, TryBegin, TryEnd, SetLineno]]:
-        instructions = super().__iter__()
+        # Items are validated here, so do not go through the validating iterator
+        # of _BaseBytecodeList which would check them a second time.
+        instructions = list.__iter__(self)
         seen_try_begin = False
         for instr in instructions:
             self._check_instr(instr)
@@ -259,6 +299,9 @@ class Bytecode(
             yield instr
 
     def _check_instr(self, instr: Any) -> None:
+        # Exact type lookup first, isinstance is only needed for subclasses
+        if type(instr) in _BYTECODE_ITEM_TYPES:
+            return
         if not isinstance(instr, (Label, SetLineno, Instr, TryBegin, TryEnd)):
             raise ValueError(
                 "Bytecode must only contain Label, "
@@ -295,26 +338,35 @@ class Bytecode(
         check_pre_and_post: bool = True,
         compute_exception_stack_depths: bool = True,
     ) -> types.CodeType:
-        # Prevent reconverting the concrete bytecode to bytecode and cfg to do the
-        # calculation if we need to do it.
-        if stacksize is None or (
+        # Exception stack depths only exist starting with Python 3.11
+        compute_exception_stack_depths = (
             sys.version_info >= (3, 11) and compute_exception_stack_depths
-        ):
-            cfg = _bytecode.ControlFlowGraph.from_bytecode(self)
-            stacksize = cfg.compute_stacksize(
-                check_pre_and_post=check_pre_and_post,
-                compute_exception_stack_depths=compute_exception_stack_depths,
+        )
+
+        # Nothing needs to be computed: convert directly to concrete bytecode.
+        if stacksize is not None and not compute_exception_stack_depths:
+            bc = self.to_concrete_bytecode(
+                compute_jumps_passes=compute_jumps_passes,
+                compute_exception_stack_depths=False,
             )
-            self = cfg.to_bytecode()
-            compute_exception_stack_depths = False  # avoid redoing everything
-        bc = self.to_concrete_bytecode(
-            compute_jumps_passes=compute_jumps_passes,
+            return bc.to_code(stacksize=stacksize, compute_exception_stack_depths=False)
+
+        # Prevent reconverting the concrete bytecode to bytecode and cfg to do the
+        # calculation if we need to do it.
+        cfg = _bytecode.ControlFlowGraph.from_bytecode(self)
+        stacksize = cfg.compute_stacksize(
+            check_pre_and_post=check_pre_and_post,
             compute_exception_stack_depths=compute_exception_stack_depths,
         )
-        return bc.to_code(
-            stacksize=stacksize,
-            compute_exception_stack_depths=compute_exception_stack_depths,
+        # The exception stack depths are stored on the TryBegin of the CFG so
+        # we need to convert it back. Otherwise the CFG was only used to
+        # compute the stack size and the original bytecode can be used as is.
+        bytecode = cfg.to_bytecode() if compute_exception_stack_depths else self
+        bc = bytecode.to_concrete_bytecode(
+            compute_jumps_passes=compute_jumps_passes,
+            compute_exception_stack_depths=False,
         )
+        return bc.to_code(stacksize=stacksize, compute_exception_stack_depths=False)
 
     def to_concrete_bytecode(
         self,
@@ -738,10 +738,12 @@ class ControlFlowGraph(_bytecode.BaseBytecode):
         jumps = []
         try_end_locations = {}
         for index, instr in enumerate(bytecode):
-            if isinstance(instr, Label):
+            # Instr are by far the most common items so test for them first.
+            if isinstance(instr, Instr):
+                if isinstance(instr.arg, Label):
+                    jumps.append((index, instr.arg))
+            elif isinstance(instr, Label):
                 label_to_block_index[instr] = index
-            elif isinstance(instr, Instr) and isinstance(instr.arg, Label):
-                jumps.append((index, instr.arg))
             elif isinstance(instr, TryBegin):
                 assert isinstance(instr.target, Label)
                 jumps.append((index, instr.target))
@@ -774,7 +776,8 @@ class ControlFlowGraph(_bytecode.BaseBytecode):
         active_try_begin: Optional[TryBegin] = None
         try_begin_inserted_in_block = False
         last_instr: Optional[Instr] = None
-        for index, instr in enumerate(bytecode):
+        # Items were validated by the first iteration above
+        for index, instr in enumerate(bytecode._iter_unchecked()):
             # Reference to the current block if we create a new one in the following.
             old_block: BasicBlock | None = None
 
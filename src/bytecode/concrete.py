@@ -229,6 +229,15 @@ class ExceptionTableEntry:
         self.stack_depth = stack_depth
         self.push_lasti = push_lasti
 
+    def _cmp_key(self) -> Tuple[int, int, int, int, bool]:
+        return (
+            self.start_offset,
+            self.stop_offset,
+            self.target,
+            self.stack_depth,
+            self.push_lasti,
+        )
+
     def __repr__(self) -> str:
         return (
             "ExceptionTableEntry("
@@ -310,6 +319,14 @@ class ConcreteBytecode(_bytecode._BaseBytecodeList[Union[ConcreteInstr, SetLinen
             return False
         if self.varnames != other.varnames:
             return False
+        # Entries do not implement __eq__ (they are used as dict keys) so compare
+        # their content.
+        if [e._cmp_key() for e in self.exception_table] != [
+            e._cmp_key() for e in other.exception_table
+        ]:
+            return False
+        if not list.__eq__(self, other):
+            return False
 
         return super().__eq__(other)
 
@@ -6,7 +6,15 @@ import textwrap
 import types
 import unittest
 
-from bytecode import Bytecode, ConcreteInstr, FreeVar, Instr, Label, SetLineno
+from bytecode import (
+    Bytecode,
+    ConcreteInstr,
+    FreeVar,
+    Instr,
+    Label,
+    SetLineno,
+    TryBegin,
+)
 from bytecode.instr import BinaryOp
 
 from . import TestCase, get_code
@@ -31,6 +39,13 @@ class BytecodeTests(TestCase):
             code.legalize()
         with self.assertRaises(ValueError):
             Bytecode([123])
+        with self.assertRaises(ValueError):
+            Bytecode(code)
+
+        label = Label()
+        code = Bytecode([TryBegin(label, False), TryBegin(label, False), label])
+        with self.assertRaises(RuntimeError):
+            Bytecode(code)
 
     def test_legalize(self):
         code = Bytecode()
@@ -140,6 +155,10 @@ class BytecodeTests(TestCase):
         b2 = Bytecode.from_code(code)
         self.assertEqual(b1, b2)
 
+        b2.append(Instr("NOP", lineno=5))
+        self.assertNotEqual(b1, b2)
+        self.assertNotEqual(b1, list(b2))
+
     def test_eq_with_try(self):
         code = get_code(
             """
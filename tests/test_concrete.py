@@ -224,6 +224,28 @@ class ConcreteBytecodeTests(TestCase):
         c.append(ConcreteInstr("LOAD_CONST", 0))
         self.assertFalse(code == c)
 
+        # Same stack size but different instructions
+        c = ConcreteBytecode()
+        c.consts = [1]
+        c.append(ConcreteInstr("NOP"))
+        self.assertFalse(code == c)
+
+    @unittest.skipIf(sys.version_info < (3, 11), "requires Python 3.11+")
+    def test_eq_exception_table(self):
+        def f():
+            try:
+                x = 1
+            except Exception:
+                x = 2
+            return x
+
+        c1 = ConcreteBytecode.from_code(f.__code__)
+        c2 = ConcreteBytecode.from_code(f.__code__)
+        self.assertTrue(c1 == c2)
+
+        c2.exception_table = []
+        self.assertFalse(c1 == c2)
+
     def test_attr(self):
         code_obj = get_code("x = 5")
         code = ConcreteBytecode.from_code(code_obj)